@@ -1,4 +1,4 @@
-# enzyme_ratio_optimization.py# enzyme_ratio_optimization.py
+# enzyme_ratio_optimization.py
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -7,11 +7,131 @@ import pandas as pd
 import numpy as np
 import pyomo.environ as pyo
 from main import build_reactor_model
-from model.solve import solve_model, solve_model_robust
+from model.solve import solve_model_robust, discretize_model
+
+def compute_yields(S):
+    """
+    S2 and S3 yields from a substrate trajectory array S of shape (3, n_time),
+    rows ordered S1, S2, S3 and columns ordered in time.
+    """
+    return S[1, -1] / S[0, 0], S[2, -1] / S[0, 0]
+
+def _error_config_info(i, EA_max, EB_max, total_enzyme, error):
+    """Print an exception raised for one configuration and return its (NaN) results row."""
+    print(f"Error: {error}")
+    import traceback
+    traceback.print_exc()
+    
+    return {
+        'config_id': i,
+        'EA_max': EA_max,
+        'EB_max': EB_max,
+        'EA_ratio': EA_max / total_enzyme,
+        'EB_ratio': EB_max / total_enzyme,
+        'S2_yield': np.nan,
+        'S3_yield': np.nan,
+        'S2_final': np.nan,
+        'S3_final': np.nan,
+        'converged': False,
+        'solver_status': f'Error: {str(error)}'
+    }
+
+def _run_configuration(test_model, i, n_configs, EA_max, EB_max, total_enzyme, warm_start=False,
+                       time_points=None):
+    """
+    Set the enzyme loadings of an already discretized model, solve it and
+    return the configuration summary (one row of the study results).
+    time_points: cached list(test_model.time); the grid is fixed once the model is discretized
+    """
+    if time_points is None:
+        time_points = list(test_model.time)
+    
+    print(f"\n{'='*60}")
+    print(f"Running configuration {i+1}/{n_configs}")
+    print(f"EA_max: {EA_max:.1f}, EB_max: {EB_max:.1f}")
+    print(f"{'='*60}")
+    
+    try:
+        # Update enzyme loadings of the already discretized model
+        test_model.EA.set_value(EA_max)
+        test_model.EB.set_value(EB_max)
+        
+        print(f"DEBUG: EA value: {test_model.EA.value}")
+        print(f"DEBUG: EB value: {test_model.EB.value}")
+        
+        # Solve model
+        solved_model, solver_results = solve_model_robust(test_model, discretize=False, warm_start=warm_start)
+        
+        if solver_results.solver.termination_condition == pyo.TerminationCondition.optimal:
+            # Extract all bulk trajectories once (straight into the array), then reduce in NumPy
+            S = np.empty((len(solved_model.Components), len(time_points)))
+            S_0 = solved_model.S_0
+            for row, c in enumerate(solved_model.Components):
+                for col, t in enumerate(time_points):
+                    S[row, col] = S_0[c, t].value
+            S2_final, S3_final = S[1, -1], S[2, -1]
+            S2_yield, S3_yield = compute_yields(S)
+            
+            # Store results
+            config_info = {
+                'config_id': i,
+                'EA_max': EA_max,
+                'EB_max': EB_max,
+                'EA_ratio': EA_max / total_enzyme,
+                'EB_ratio': EB_max / total_enzyme,
+                'S2_yield': S2_yield,
+                'S3_yield': S3_yield,
+                'S2_final': S2_final,
+                'S3_final': S3_final,
+                'converged': True,
+                'solver_status': 'optimal'
+            }
+            
+            print(f"[SUCCESS] Success: S3 yield = {S3_yield:.4f}")
+            
+        else:
+            config_info = {
+                'config_id': i,
+                'EA_max': EA_max,
+                'EB_max': EB_max,
+                'EA_ratio': EA_max / total_enzyme,
+                'EB_ratio': EB_max / total_enzyme,
+                'S2_yield': np.nan,
+                'S3_yield': np.nan,
+                'S2_final': np.nan,
+                'S3_final': np.nan,
+                'converged': False,
+                'solver_status': str(solver_results.solver.termination_condition)
+            }
+            print(f"[FAIL] Failed: {solver_results.solver.termination_condition}")  
+    
+    except Exception as e:
+        config_info = _error_config_info(i, EA_max, EB_max, total_enzyme, e)
+    
+    return config_info
+
+def _solve_one(args):
+    """
+    Pool worker: build, discretize and solve one configuration in its own process.
+    """
+    i, n_configs, EA_max, EB_max, total_enzyme, decay_coef, bvp_kwargs = args
+    
+    # IPOPT is launched from this process; one thread each avoids oversubscribing the cores
+    os.environ['OMP_NUM_THREADS'] = '1'
+    
+    # A failing build is recorded for this configuration only (an exception would abort Pool.map)
+    try:
+        test_model = build_reactor_model(immobilization='co-immobilization', 
+                                         decay_coef=decay_coef, 
+                                         bvp_kwargs=bvp_kwargs)
+        discretize_model(test_model)
+    except Exception as e:
+        return _error_config_info(i, EA_max, EB_max, total_enzyme, e)
+    return _run_configuration(test_model, i, n_configs, EA_max, EB_max, total_enzyme)
 
 def run_enzyme_ratio_study(decay_coef={'kA': 0, 'kB': 0}, 
                           bvp_kwargs_template=None, total_enzyme=10, 
-                          num_points=11, save_results=False):
+                          num_points=11, save_results=False, n_workers=1):
     """
     DOCS
     """
@@ -24,98 +144,45 @@ def run_enzyme_ratio_study(decay_coef={'kA': 0, 'kB': 0},
             'enzymeB': {'fun': 'linear', 'start': 0, 'end': 1}
         }
     
-    results = []
-    
     # Generate EA_max values from 0 to total_enzyme
     EA_values = np.linspace(0.1*total_enzyme, 0.9*total_enzyme, num_points)
     
-    for i, EA_max in enumerate(EA_values):
-        EB_max = total_enzyme - EA_max
-        
-        print(f"\n{'='*60}")
-        print(f"Running configuration {i+1}/{len(EA_values)}")
-        print(f"EA_max: {EA_max:.1f}, EB_max: {EB_max:.1f}")
-        print(f"{'='*60}")
+    if n_workers != 1:
+        # Configurations are independent: one model per worker process, no warm start
+        # (n_workers=None uses all cores)
+        from multiprocessing import Pool
+        task_args = [(i, len(EA_values), EA_max, total_enzyme - EA_max, total_enzyme, 
+                      decay_coef, bvp_kwargs_template) for i, EA_max in enumerate(EA_values)]
+        with Pool(n_workers) as p:
+            results = p.map(_solve_one, task_args)
+    else:
+        results = []
         
+        # Build and discretize ONE model; EA/EB are mutable Params updated per configuration,
+        # and each solve is warm-started from the previous configuration's solution
         try:
-            # Build a NEW model for each configuration (not cloned)
             test_model = build_reactor_model(immobilization='co-immobilization', 
                                              decay_coef=decay_coef, 
                                              bvp_kwargs=bvp_kwargs_template)
+            discretize_model(test_model)
+        except Exception as e:
+            # Every configuration shares this model: record the error for all of them
+            results = [_error_config_info(i, EA_max, total_enzyme - EA_max, total_enzyme, e)
+                       for i, EA_max in enumerate(EA_values)]
+        else:
+            time_points = list(test_model.time)
             
-            # Set enzyme values BEFORE any expressions are created
-            test_model.EA.set_value(EA_max)
-            test_model.EB.set_value(EB_max)
-            
-            print(f"DEBUG: EA value: {test_model.EA.value}")
-            print(f"DEBUG: EB value: {test_model.EB.value}")
-            
-            # Solve model
-            solved_model, solver_results = solve_model_robust(test_model)
-            
-            if solver_results.solver.termination_condition == pyo.TerminationCondition.optimal:
-                # Extract results
-                from pyomo.environ import value
-                S1_initial = value(solved_model.S_0['S1', solved_model.time.first()])
-                S2_final = value(solved_model.S_0['S2', solved_model.time.last()])
-                S3_final = value(solved_model.S_0['S3', solved_model.time.last()])
-                
-                S2_yield = S2_final / S1_initial
-                S3_yield = S3_final / S1_initial
-                
-                # Store results
-                config_info = {
-                    'config_id': i,
-                    'EA_max': EA_max,
-                    'EB_max': EB_max,
-                    'EA_ratio': EA_max / total_enzyme,
-                    'EB_ratio': EB_max / total_enzyme,
-                    'S2_yield': S2_yield,
-                    'S3_yield': S3_yield,
-                    'S2_final': S2_final,
-                    'S3_final': S3_final,
-                    'converged': True,
-                    'solver_status': 'optimal'
-                }
+            for i, EA_max in enumerate(EA_values):
+                EB_max = total_enzyme - EA_max
+                config_info = _run_configuration(test_model, i, len(EA_values), EA_max, EB_max, 
+                                                 total_enzyme, warm_start=True, 
+                                                 time_points=time_points)
                 
-                print(f"[SUCCESS] Success: S3 yield = {S3_yield:.4f}")
+                # Do not warm-start the next configuration from a failed solve
+                if not config_info['converged'] and hasattr(test_model, 'dual'):
+                    test_model.dual.clear()
                 
-            else:
-                config_info = {
-                    'config_id': i,
-                    'EA_max': EA_max,
-                    'EB_max': EB_max,
-                    'EA_ratio': EA_max / total_enzyme,
-                    'EB_ratio': EB_max / total_enzyme,
-                    'S2_yield': np.nan,
-                    'S3_yield': np.nan,
-                    'S2_final': np.nan,
-                    'S3_final': np.nan,
-                    'converged': False,
-                    'solver_status': str(solver_results.solver.termination_condition)
-                }
-                print(f"[FAIL] Failed: {solver_results.solver.termination_condition}")  
-        
-        except Exception as e:
-            print(f"Error: {e}")
-            import traceback
-            traceback.print_exc()
-            
-            config_info = {
-                'config_id': i,
-                'EA_max': EA_max,
-                'EB_max': EB_max,
-                'EA_ratio': EA_max / total_enzyme,
-                'EB_ratio': EB_max / total_enzyme,
-                'S2_yield': np.nan,
-                'S3_yield': np.nan,
-                'S2_final': np.nan,
-                'S3_final': np.nan,
-                'converged': False,
-                'solver_status': f'Error: {str(e)}'
-            }
-        
-        results.append(config_info)
+                results.append(config_info)
     
     # Create DataFrame and save results
     results_df = pd.DataFrame(results)
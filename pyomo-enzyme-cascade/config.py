@@ -8,6 +8,7 @@ and numerical solver settings.
 # -------------------------------
 # Batch reactor parameters settings
 # -------------------------------
+COMPONENTS      = ('S1', 'S2', 'S3')    # Substrate components (cascade order S1 -> S2 -> S3)
 INITIAL_SUBSTRATE_CONC = {
     "S1_0"  : 1000,
     "S2_0"  : 0.1,
@@ -50,3 +51,10 @@ MICHAELIS_MENTEN_CONST  = {
     "Enzyme_A"  : 5,
     "Enzyme_B"  : 10
 }           # K_j, mM, Michaelis-Menten constant
+
+# -------------------------------
+# Numerical settings
+# -------------------------------
+PORE_MESH_ELEMENTS      = 20    # -, finite elements seeded along the pore length x
+PORE_MESH_CLUSTERING    = 1.25  # -, element boundaries at L*(i/n)**p; p > 1 clusters them near the pore mouth (x=0)
+                                # (pyomo.dae rounds new points to 1e-6, so the smallest element must stay well above that)
@@ -1,7 +1,12 @@
 # model.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pyomo.environ as pyo
 import pyomo.dae as dae
 
+import config
 import params_initialization
 from model.pore_concentration_profile import add_bvp_constraints
 from model.reactor_concentration_profile import add_reactor_odes
@@ -9,16 +14,20 @@ from model.reactor_concentration_profile import add_reactor_odes
 def build_reactor_model(immobilization='co-immobilization', decay_coef={'kA':0, 'kB':0}, **kwargs):
     model = pyo.ConcreteModel()
     
-    # Model parameters indexing - one stage, 3 substrates
-    model.Stage      = pyo.Set(initialize=[1])  # Single stage
-    model.Components = pyo.Set(initialize=['S1', 'S2', 'S3']) # Substrate components
+    # Model parameters indexing - 3 substrates (single stage)
+    model.Components = pyo.Set(initialize=config.COMPONENTS) # Substrate components (ordered)
 
     # Load parameters
     model = params_initialization.load_parameters(model)  # load_parameters.py
 
     # Establish model time and space domains (independent vars.)
     model.time  = dae.ContinuousSet(bounds=(0,model.tf))     # Reaction time
-    model.x     = dae.ContinuousSet(bounds=(0, model.L))     # Pore x-spatial dimension
+    # Pore x-spatial dimension. High Thiele modulus: S1 is consumed in a thin layer near the
+    # pore mouth, so element boundaries are seeded clustered towards x=0 (kept by pyomo.dae
+    # when discretizing with nfe equal to the number of seeded elements)
+    n_x, p_x = config.PORE_MESH_ELEMENTS, config.PORE_MESH_CLUSTERING
+    x_nodes = [pyo.value(model.L) * (i / n_x)**p_x for i in range(n_x + 1)]
+    model.x     = dae.ContinuousSet(bounds=(0, model.L), initialize=x_nodes)
 
     # State variables (for IVP) index order:-> Components, time
     model.S_0 = pyo.Var(model.Components, model.time) # Bulk concentration of substrates    
@@ -37,6 +46,78 @@ def build_reactor_model(immobilization='co-immobilization', decay_coef={'kA':0,
     
     return model
 
+def _solve_reactor_case(args):
+    """
+    Worker for sweep_reactor_models: build and solve one model in this process and
+    return its trajectories as plain arrays (the Pyomo model itself is not sent back).
+    """
+    from model.solve import solve_model_robust
+    bvp_kwargs, immobilization, decay_coef = args
+    
+    # One IPOPT thread per worker process avoids oversubscribing the cores
+    os.environ['OMP_NUM_THREADS'] = '1'
+    
+    # A failing build or solve is recorded for this configuration only (an exception would
+    # abort executor.map and discard every other result)
+    model = None
+    try:
+        model = build_reactor_model(immobilization=immobilization, decay_coef=decay_coef, bvp_kwargs=bvp_kwargs)
+        model, results = solve_model_robust(model)
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        converged, solver_status = False, f'Error: {str(e)}'
+    else:
+        converged = results.solver.termination_condition == pyo.TerminationCondition.optimal
+        solver_status = str(results.solver.termination_condition)
+    
+    # Time grid of the model as far as it got (empty if it could not be built)
+    t_values = np.fromiter(model.time.ordered_data(), dtype=float) if model is not None else np.empty(0)
+    shape = (len(config.COMPONENTS), len(t_values))
+    S_0 = np.full(shape, np.nan)
+    flux = np.full(shape, np.nan)
+    if converged:
+        # Written straight into the result arrays (no per-row lists)
+        S_0_var, flux_expr = model.S_0, model.flux
+        for i, c in enumerate(model.Components):
+            for j, t in enumerate(model.time):
+                S_0[i, j] = S_0_var[c, t].value
+                flux[i, j] = flux_expr[c, t]()
+    
+    return {
+        'bvp_kwargs': bvp_kwargs,
+        'converged': converged,
+        'solver_status': solver_status,
+        'time': t_values,
+        'S_0': S_0,     # (component, time), rows ordered as model.Components
+        'flux': flux,   # (component, time)
+    }
+
+def sweep_reactor_models(bvp_kwargs_list, immobilization='co-immobilization', decay_coef={'kA':0, 'kB':0}, 
+                         max_workers=None):
+    """
+    Build and solve one reactor model per bvp_kwargs entry, in parallel worker processes.
+    
+    Each configuration is independent, so every worker builds, discretizes and solves its
+    own model (IPOPT/MUMPS are not shared between processes). Only the bvp_kwargs dicts
+    are sent to the workers and only NumPy arrays come back.
+    
+    Parameters:
+    bvp_kwargs_list: list of bvp_kwargs dicts (see build_reactor_model / add_bvp_constraints)
+    immobilization: 'co-immobilization' or 'single'
+    decay_coef: enzyme decay coefficients {'kA': ..., 'kB': ...}
+    max_workers: number of worker processes (default: os.cpu_count())
+    
+    Returns:
+    list of dicts (same order as bvp_kwargs_list) with keys 'bvp_kwargs', 'converged', 
+    'solver_status', 'time', 'S_0' and 'flux'; S_0 and flux are NaN if the solve failed
+    (solver_status 'Error: ...' if building or solving raised)
+    """
+    task_args = [(bvp_kwargs, immobilization, decay_coef) for bvp_kwargs in bvp_kwargs_list]
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(_solve_reactor_case, task_args))
+
 if __name__ == "__main__":
     from model.solve import solve_model_robust
     import visualization.model_visualization as m_viz
@@ -1,38 +1,53 @@
 # pore_concentration_profile.py
+import math
 import pyomo.environ as pyo
 import pyomo.dae as dae
 import numpy as np
 from .utils import enzyme_profile_rule, calculate_pore_count_coefficient
 
 def add_bvp_constraints(model, immobilization='co-immobilization', decay_coef={'kA':0, 'kB':0}, bvp_kwargs=None): 
-    # --- Create symbolic enzyme decay profiles (Expressions) ---
+    # --- Enzyme decay profiles (numeric Params over time) ---
     kA_decay = decay_coef.get('kA', 0.0)
     kB_decay = decay_coef.get('kB', 0.0)
 
     if kA_decay > 0:
-        model.decay_A = pyo.Expression(model.time, rule=lambda m, t: pyo.exp(-kA_decay * t))
+        decay_A_rule = lambda m, t: math.exp(-kA_decay * t)
     else:
-        model.decay_A = pyo.Expression(model.time, rule=lambda m, t: 1.0)
+        decay_A_rule = lambda m, t: 1.0
 
     if kB_decay > 0:
-        model.decay_B = pyo.Expression(model.time, rule=lambda m, t: pyo.exp(-kB_decay * t))
+        decay_B_rule = lambda m, t: math.exp(-kB_decay * t)
     else:
-        model.decay_B = pyo.Expression(model.time, rule=lambda m, t: 1.0)
+        decay_B_rule = lambda m, t: 1.0
+
+    # The default rule fills in the time points added by discretization on first access
+    model.decay_A = pyo.Param(model.time, initialize=decay_A_rule, default=decay_A_rule, within=pyo.NonNegativeReals)
+    model.decay_B = pyo.Param(model.time, initialize=decay_B_rule, default=decay_B_rule, within=pyo.NonNegativeReals)
         
+    # Index-independent components, looked up once instead of once per (x, t) rule call.
+    # D and k are immutable and enter the constraints as plain floats; EA/EB stay
+    # (mutable) Params so they can be updated after the model is built
+    D_S1, D_S2, D_S3 = (pyo.value(model.D[c]) for c in model.Components)
+    kA, kB = pyo.value(model.kA), pyo.value(model.kB)
+    EA, EB = model.EA, model.EB
+    # decay_A/B[t] are floats: (decay[t] * k) folds into one rate constant per t, so no
+    # extra factor is emitted (the decay Params are kept for plotting, also when k == 0)
+    decay_A, decay_B = model.decay_A, model.decay_B
+
     if immobilization == 'single':
         
         # --- ODE system (Equations 3, 6, 7) ---
         # Diffusion-reaction ODE in pore alpha-A (Enzyme A only)
         def typeA_pore_bvp_rule(m, x, t):
-            return m.D['S1'] * m.d2S_ndx2['S1', x, t] == (
-                m.EA * m.decay_A[t] * m.kA * m.S_n['S1', x, t]
+            return D_S1 * m.d2S_ndx2['S1', x, t] == (
+                EA * (decay_A[t] * kA) * m.S_n['S1', x, t]
             )   
         model.typeA_pore_bvp = pyo.Constraint(model.x, model.time, rule=typeA_pore_bvp_rule)
         
         # Diffusion-reaction ODE in pore alpha-B (Enzyme B only)
         def typeB_pore_bvp_rule(m, x, t):
-            return m.D['S2'] * m.d2S_ndx2['S2', x, t] == (
-                m.EB * m.decay_B[t] * m.kB * m.S_n['S2', x, t]
+            return D_S2 * m.d2S_ndx2['S2', x, t] == (
+                EB * (decay_B[t] * kB) * m.S_n['S2', x, t]
             )
         model.typeB_pore_bvp = pyo.Constraint(model.x, model.time, rule=typeB_pore_bvp_rule)
     
@@ -46,14 +61,13 @@ def add_bvp_constraints(model, immobilization='co-immobilization', decay_coef={'
         EB_fun = enzymeB_kwargs.get('fun', default_fun) 
         
         # Enzyme A profile: High at entry, low at end of pores (default). 
-        model.EA_x_profile = enzyme_profile_rule(
-            model,
-            model.EA,
+        EA_profile_kwargs = dict(
             start=enzymeA_kwargs.get('start', 1),
             end=enzymeA_kwargs.get('end', 0),
             fun=EA_fun,
             **{k: v for k, v in enzymeA_kwargs.items() if k not in ['fun', 'start', 'end']}
         )
+        model.EA_x_profile = enzyme_profile_rule(model, model.EA, **EA_profile_kwargs)
         # Enzyme B: low at entry, high at end of pores (default). 
         model.EB_x_profile = enzyme_profile_rule(
             model,
@@ -63,25 +77,29 @@ def add_bvp_constraints(model, immobilization='co-immobilization', decay_coef={'
             fun=EB_fun,
             **{k: v for k, v in enzymeB_kwargs.items() if k not in ['fun', 'start', 'end']}
         )
+        EA_x_profile, EB_x_profile = model.EA_x_profile, model.EB_x_profile
+
+        # Local reaction rates, shared by the S1/S2 (rA) and S2/S3 (rB) balances
+        def rA_rule(m, x, t):
+            return EA_x_profile[x] * (decay_A[t] * kA) * m.S_n['S1', x, t]
+        model.rA = pyo.Expression(model.x, model.time, rule=rA_rule)
+
+        def rB_rule(m, x, t):
+            return EB_x_profile[x] * (decay_B[t] * kB) * m.S_n['S2', x, t]
+        model.rB = pyo.Expression(model.x, model.time, rule=rB_rule)
+        rA, rB = model.rA, model.rB
+
         # --- ODE system (Equations 3, 6, 7) --- 
-        def S1_mixed_pore_bvp_rule(m, x, t):
-            return m.D['S1'] * m.d2S_ndx2['S1', x, t] == (
-                m.EA_x_profile[x] * m.decay_A[t] * m.kA * m.S_n['S1', x, t]
-            )
-        model.S1_mixed_pore_bvp = pyo.Constraint(model.x, model.time, rule=S1_mixed_pore_bvp_rule)  
-              
-        def S2_mixed_pore_bvp_rule(m, x, t):
-            return m.D['S2'] * m.d2S_ndx2['S2', x, t] == (
-                m.EB_x_profile[x] * m.decay_B[t] * m.kB * m.S_n['S2', x, t] 
-                - m.EA_x_profile[x] * m.decay_A[t] * m.kA * m.S_n['S1', x, t]
-            )
-        model.S2_mixed_pore_bvp = pyo.Constraint(model.x, model.time, rule=S2_mixed_pore_bvp_rule)
-        
-        def S3_mixed_pore_bvp_rule(m, x, t):
-            return m.D['S3'] * m.d2S_ndx2['S3', x, t] == (
-                m.EB_x_profile[x] * m.decay_B[t] * m.kB * m.S_n['S2', x, t]
-            )
-        model.S3_mixed_pore_bvp = pyo.Constraint(model.x, model.time, rule=S3_mixed_pore_bvp_rule)         
+        # One constraint over (component, x, t); net reaction term per component
+        D = {'S1': D_S1, 'S2': D_S2, 'S3': D_S3}
+        net_rate = {
+            'S1': lambda x, t: rA[x, t],                # S1 consumed by enzyme A
+            'S2': lambda x, t: rB[x, t] - rA[x, t],     # S2 produced by A, consumed by B
+            'S3': lambda x, t: rB[x, t],                # S3 produced by enzyme B
+        }
+        def mixed_pore_bvp_rule(m, component, x, t):
+            return D[component] * m.d2S_ndx2[component, x, t] == net_rate[component](x, t)
+        model.mixed_pore_bvp = pyo.Constraint(model.Components, model.x, model.time, rule=mixed_pore_bvp_rule)
     else:
         raise Exception("Invalid immobilization scheme!")
     
@@ -99,19 +117,21 @@ def add_bvp_constraints(model, immobilization='co-immobilization', decay_coef={'
     # Flux expression (used in reactor ODE) --> Equation 2 Right-hand side    
     if immobilization == 'single':
         # Pore ratio TypeA : TypeB = 50:50
-        def flux_rule(m, component, t):
-            return -m.D[component] * m.dS_ndx[component, m.x.first(), t] * m.A * m.Np / 2
- 
-        model.flux = pyo.Expression(model.Components, model.time, rule=flux_rule)
+        pore_count_coef = 1
         
     elif immobilization == 'co-immobilization':
         # Whether to adjust pore number to get equal total activity
         if bvp_kwargs.get('adjust_Np', False):
-            pore_count_coef = calculate_pore_count_coefficient(model, model.EA_x_profile, model.EA)
+            pore_count_coef = calculate_pore_count_coefficient(model, model.EA, **EA_profile_kwargs)
         else:
             pore_count_coef = 2
-            
-        def flux_rule(m, component, t):
-            return -m.D[component] * m.dS_ndx[component, 0, t] * m.A * m.Np * pore_count_coef / 2
 
-        model.flux = pyo.Expression(model.Components, model.time, rule=flux_rule)
+    # D, A and Np are fixed at build time: fold them into one coefficient per component
+    flux_coef = {
+        c: -pyo.value(model.D[c]) * pyo.value(model.A) * pyo.value(model.Np) * pore_count_coef / 2
+        for c in model.Components
+    }
+    def flux_rule(m, component, t):
+        return flux_coef[component] * m.dS_ndx[component, m.x.first(), t]
+
+    model.flux = pyo.Expression(model.Components, model.time, rule=flux_rule)
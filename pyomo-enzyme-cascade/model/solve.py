@@ -1,38 +1,175 @@
 # solve.py
+"""
+Discretization and IPOPT solve routines for the reactor kinetics model.
+
+The HSL linear solvers (ma27, ma57, ma86, ma97) are substantially faster than IPOPT's
+default MUMPS on the sparse, banded KKT systems produced by DAE collocation, but they
+are not bundled with open-source IPOPT builds. HSL is free for academic use and
+needs a separate (commercial) licence otherwise; install it from
+https://licences.stfc.ac.uk/product/coin-hsl and make libhsl visible to IPOPT, or
+pass linear_solver='mumps'.
+"""
 import pyomo.environ as pyo
 import pyomo.dae as dae
 
-def solve_model(model):
+def solve_model(model, nfe_x=60, scheme='BACKWARD', aggregate_vars=False, linear_solver='ma57',
+                discretize=True):
     """
     Discretize and solve the reactor kinetics model.
-    
+
     Parameters:
     model: Pyomo model to solve
-    
+    nfe_x: Number of finite difference elements along the pore length (x)
+    scheme: Finite difference scheme for x ('BACKWARD' or 'FORWARD'). 'CENTRAL' leaves
+            dS_ndx undefined at both pore ends, so the pore BVP is no longer square
+    aggregate_vars: If True, merge variables linked by equality constraints (e.g. bc1,
+            S_n[c,0,t] == S_0[c,t]) before solving. Shrinks the NLP, but the presolve pass
+            itself is slow on large meshes
+    linear_solver: IPOPT linear solver ('ma57', 'ma86', ... require HSL; 'mumps' is always available).
+            HSL solvers this IPOPT build cannot load fall back to 'ma97', then to 'mumps'
+    discretize: If False, the model is assumed to be discretized (and aggregated) already
+
     Returns:
     model: Solved model
-    results: Solver results
+    results: Solver results (see results.solver.termination_condition)
     """
-    print("Discretizing model...")
-    
-    # Discretize time and space (x) variables
-    discretizer = pyo.TransformationFactory('dae.collocation')
-    discretizer.apply_to(model, wrt=model.time, nfe=40, ncp=2)  # Total discretization points = nfe*ncp
-    discretizer.apply_to(model, wrt=model.x, nfe=20, ncp=3)
-    
-    print("Discretization completed.")
+    if discretize:
+        print("Discretizing model...")
+
+        # Discretize time (collocation) and space x (finite difference, tri-diagonal Jacobian in x)
+        discretizer = pyo.TransformationFactory('dae.collocation')
+        discretizer.apply_to(model, wrt=model.time, nfe=20, ncp=3)  # Total discretization points = nfe*ncp
+        pyo.TransformationFactory('dae.finite_difference').apply_to(model, wrt=model.x, nfe=nfe_x, scheme=scheme)
+
+        print("Discretization completed.")
+
+        if aggregate_vars:
+            _aggregate_linked_vars(model)
+
     print("Solving model with IPOPT...")
     
     # Solve model
     solver = pyo.SolverFactory('ipopt')
-    results = solver.solve(model, tee=True)
+    linear_solver = _select_linear_solver(linear_solver)
+    solver.options['linear_solver'] = linear_solver
+    # Every constraint is linear in the variables (EA, EB and decay are Params), so the
+    # Jacobian is constant and the Lagrangian Hessian is zero: evaluate both only once
+    solver.options['hessian_constant'] = 'yes'
+    solver.options['jac_c_constant'] = 'yes'
+    if linear_solver == 'ma57':
+        solver.options['ma57_automatic_scaling'] = 'yes'
+    elif linear_solver == 'mumps':
+        solver.options['mumps_mem_percent'] = 50
+    results = solver.solve(model, tee=True, symbolic_solver_labels=False, keepfiles=False)
+
+    _restore_aggregated_vars(model)
     
     print(f"Solver termination condition: {results.solver.termination_condition}")
     print(f"Solver status: {results.solver.status}")
     
     return model, results
 
-def solve_model_robust(model, max_iter=5000, tol=1e-6, verbose=False):
+def discretize_model(model, nfe_t=30, ncp_t=3, nfe_x=None, ncp_x=3):
+    """
+    Apply orthogonal (LAGRANGE-RADAU) collocation to the time and pore-length (x) domains.
+
+    Parameters
+    ----------
+    model : pyo.ConcreteModel
+        Undiscretized reactor model from build_reactor_model.
+    nfe_t, ncp_t : int, optional
+        Finite elements and collocation points per element in time (default: 30, 3).
+    nfe_x, ncp_x : int, optional
+        Finite elements and collocation points per element along x (default: one element per 
+        interval seeded by build_reactor_model, i.e. config.PORE_MESH_ELEMENTS, and 3). Any 
+        other nfe_x makes pyomo.dae add points, distorting the clustered element boundaries.
+
+    Returns
+    -------
+    model : pyo.ConcreteModel
+        The discretized model (transformed in place).
+    """
+    discretizer = pyo.TransformationFactory('dae.collocation')
+    # Radau is L-stable, so the stiff decay transients need fewer (higher order) time elements
+    discretizer.apply_to(model, wrt=model.time, nfe=nfe_t, ncp=ncp_t, scheme='LAGRANGE-RADAU')
+    if nfe_x is None:
+        nfe_x = len(model.x) - 1    # seeded element boundaries are kept as they are
+    discretizer.apply_to(model, wrt=model.x, nfe=nfe_x, ncp=ncp_x, scheme='LAGRANGE-RADAU')
+    return model
+
+def _aggregate_linked_vars(model):
+    """
+    Merge variables linked by simple equalities into one aggregate variable. For the
+    reactor model this eliminates bc1 (S_n[c,0,t] == S_0[c,t]): one constraint and one
+    variable per (component, time), which pyomo.dae cannot drop itself because its
+    discretization equations still reference S_n[c,0,t].
+    """
+    pyo.TransformationFactory('contrib.aggregate_vars').apply_to(model)
+    pyo.TransformationFactory('contrib.init_vars_midpoint').apply_to(model)
+
+def _restore_aggregated_vars(model):
+    """Copy aggregate values back to the variables they replaced (no-op if not aggregated)."""
+    if hasattr(model, '_var_aggregator_info'):
+        pyo.TransformationFactory('contrib.aggregate_vars').update_variables(model)
+
+def _add_warm_start_suffixes(model):
+    """Declare the IPOPT multiplier suffixes used to warm-start later solves."""
+    if not hasattr(model, 'dual'):
+        model.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT_EXPORT)
+        model.ipopt_zL_out = pyo.Suffix(direction=pyo.Suffix.IMPORT)
+        model.ipopt_zU_out = pyo.Suffix(direction=pyo.Suffix.IMPORT)
+        model.ipopt_zL_in = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+        model.ipopt_zU_in = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+
+# Linear solver name -> whether this IPOPT build can load it (probed once per process)
+_linear_solver_available = {}
+
+def _has_linear_solver(linear_solver):
+    """Check once whether IPOPT can run with the given linear solver (HSL may be missing)."""
+    if linear_solver not in _linear_solver_available:
+        probe = pyo.ConcreteModel()
+        probe.x = pyo.Var(initialize=1.0)
+        probe.y = pyo.Var(initialize=1.0)
+        probe.c = pyo.Constraint(expr=probe.x + probe.y == 1)
+        probe.obj = pyo.Objective(expr=(probe.x - probe.y)**2)
+        try:
+            results = pyo.SolverFactory('ipopt').solve(
+                probe, options={'linear_solver': linear_solver, 'print_level': 0})
+            available = results.solver.termination_condition == pyo.TerminationCondition.optimal
+        except Exception:
+            available = False
+        _linear_solver_available[linear_solver] = available
+    return _linear_solver_available[linear_solver]
+
+def _select_linear_solver(linear_solver):
+    """Return linear_solver if available, else fall back to 'ma97' and finally 'mumps'."""
+    if linear_solver == 'mumps':
+        return 'mumps'      # always available, and an explicit request is kept
+    for candidate in (linear_solver, 'ma97'):
+        if _has_linear_solver(candidate):
+            return candidate
+    return 'mumps'
+
+def _copy_solution(source, target):
+    """
+    Copy Var values and, if present, IPOPT multipliers from a solved model onto a model
+    with the same discretization (components are matched by name).
+    """
+    var_values = {v.name: v.value for v in source.component_data_objects(pyo.Var)}
+    for v in target.component_data_objects(pyo.Var):
+        if v.name in var_values:
+            v.value = var_values[v.name]
+
+    if hasattr(source, 'dual') and hasattr(target, 'dual'):
+        for suffix_name, ctype in (('dual', pyo.Constraint), ('ipopt_zL_out', pyo.Var), ('ipopt_zU_out', pyo.Var)):
+            source_values = {comp.name: val for comp, val in getattr(source, suffix_name).items()}
+            target_suffix = getattr(target, suffix_name)
+            for comp in target.component_data_objects(ctype):
+                if comp.name in source_values:
+                    target_suffix[comp] = source_values[comp.name]
+
+def solve_model_robust(model, max_iter=5000, tol=1e-6, verbose=False, discretize=True, warm_start=False,
+                       aggregate_vars=False, linear_solver='ma57', warm_start_from=None):
     """
     Discretize and solve the Pyomo DAE model using IPOPT with robust solver settings.
 
@@ -46,6 +183,23 @@ def solve_model_robust(model, max_iter=5000, tol=1e-6, verbose=False):
         Solver tolerance for convergence (default: 1e-6).
     verbose : bool, optional
         If True, print progress messages and solver logs (default: True).
+    discretize : bool, optional
+        If False, the model is assumed to be discretized already, e.g. when
+        re-solving the same model with new parameter values (default: True).
+    warm_start : bool, optional
+        If True, keep IPOPT's multipliers on the model and, when a previous solve
+        has left them there, start IPOPT from that primal-dual point (default: False).
+    aggregate_vars : bool, optional
+        If True, eliminate the bc1 equalities by variable aggregation after
+        discretization. Smaller KKT system, but the presolve pass is slow on large
+        meshes (default: False).
+    linear_solver : str, optional
+        IPOPT linear solver (default: 'ma57'). HSL solvers that this IPOPT build
+        cannot load fall back to 'ma97', then to 'mumps'.
+    warm_start_from : pyo.ConcreteModel, optional
+        A previously solved model with the same discretization (e.g. the previous
+        point of a sweep). Its Var values, and its multipliers if it was solved with
+        warm_start=True, initialize this solve; implies warm_start=True (default: None).
 
     Returns
     -------
@@ -54,16 +208,20 @@ def solve_model_robust(model, max_iter=5000, tol=1e-6, verbose=False):
     results : SolverResults
         The IPOPT solver result object containing status and termination info.
     """
-    if verbose:
-        print("Discretizing model...")
+    if discretize:
+        if verbose:
+            print("Discretizing model...")
 
-    # Discretize time and space
-    discretizer = pyo.TransformationFactory('dae.collocation')
-    discretizer.apply_to(model, wrt=model.time, nfe=60, ncp=2)
-    discretizer.apply_to(model, wrt=model.x, nfe=20, ncp=3)
+        # Discretize time and space
+        discretize_model(model)
+
+        if verbose:
+            print("Discretization completed.")
+
+        if aggregate_vars:
+            _aggregate_linked_vars(model)
 
     if verbose:
-        print("Discretization completed.")
         print("Solving model with IPOPT (robust settings)...")
 
     # Configure IPOPT solver
@@ -81,29 +239,48 @@ def solve_model_robust(model, max_iter=5000, tol=1e-6, verbose=False):
         'nlp_scaling_method': 'gradient-based',
         'obj_scaling_factor': 1.0,
         'print_level': 5 if verbose else 0,
-        'linear_solver': 'mumps'
+        'linear_solver': _select_linear_solver(linear_solver),
+        # Linear constraints, no objective: constant Jacobian and zero Hessian
+        'hessian_constant': 'yes',
+        'jac_c_constant': 'yes',
+        # Help IPOPT through difficult starts itself (lighter restoration-phase target,
+        # multiplier re-estimation) instead of re-solving from scratch with relaxed settings
+        'required_infeasibility_reduction': 0.5,
+        'recalc_y': 'yes',
+        'recalc_y_feas_tol': 1e-2,
     }
-    solver_options['linear_solver'] = 'mumps'
+    if solver_options['linear_solver'] == 'ma57':
+        solver_options['ma57_automatic_scaling'] = 'yes'
+        solver_options['ma57_pre_alloc'] = 3.0
+
+    if warm_start_from is not None:
+        warm_start = True
+        _add_warm_start_suffixes(model)
+        _copy_solution(warm_start_from, model)
+
+    if warm_start:
+        has_prior_solution = hasattr(model, 'dual') and len(model.dual) > 0
+        _add_warm_start_suffixes(model)
+        if has_prior_solution:
+            # Start from the previous primal-dual point (Var values are kept on the model)
+            solver_options.update({
+                'warm_start_init_point': 'yes',
+                'warm_start_bound_push': 1e-9,
+                'warm_start_mult_bound_push': 1e-9,
+                'mu_init': 1e-6,
+            })
+            model.ipopt_zL_in.update(model.ipopt_zL_out)
+            model.ipopt_zU_in.update(model.ipopt_zU_out)
+
     for k, v in solver_options.items():
         solver.options[k] = v
 
-    try:
-        results = solver.solve(model, tee=verbose)
-    except Exception as e:
-        if verbose:
-            print(f"First solve attempt failed: {e}")
-            print("Retrying with more relaxed settings...")
-
-        solver_options.update({
-            'max_iter': 5000,
-            'tol': 1e-4,
-            'mu_init': 1e-3,
-            'bound_relax_factor': 1e-6,
-        })
-        for k, v in solver_options.items():
-            solver.options[k] = v
-
-        results = solver.solve(model, tee=verbose)
+    # Unlabelled NL file (no name strings to write/parse); constraints left without
+    # variables (e.g. after aggregation) are dropped from the NL stream
+    results = solver.solve(model, tee=verbose, symbolic_solver_labels=False, keepfiles=False,
+                           io_options={'skip_trivial_constraints': True})
+
+    _restore_aggregated_vars(model)
 
     if verbose:
         print(f"Solver termination condition: {results.solver.termination_condition}")
@@ -1,3 +1,5 @@
+import functools
+import numpy as np
 import pyomo.environ as pyo
 import pyomo.dae as dae
 
@@ -6,6 +8,8 @@ def enzyme_profile_rule(model, E_max, start=1, end=0, fun='linear', **kwargs):
     Add configurable enzyme distribution
     
     Parameters:
+    E_max: maximum enzyme density. A mutable Param (m.EA, m.EB) keeps the profile symbolic so it
+           follows later set_value() calls; a float or immutable Param gives a numeric linear profile
     fun: enzyme density distribution function throughout pore length (density between 0 and maximum enzyme density m.EA & m.EB)
             - linear    : linear function
             - step      : step function (must define x_step as 0 to 1)
@@ -26,9 +30,7 @@ def enzyme_profile_rule(model, E_max, start=1, end=0, fun='linear', **kwargs):
         raise ValueError("'start' and 'end' must be between 0 and 1")
 
     if fun == 'linear':
-        def profile_rule(m, x):
-            return E_max * (start + (end - start) * (x/m.L))
-        return pyo.Expression(model.x, rule=profile_rule)
+        shape_kwargs = {}
     
     elif fun == 'step':
         x_step_up   = kwargs.get('x_step_up', 0.3)      # Start of step-up transition
@@ -42,36 +44,76 @@ def enzyme_profile_rule(model, E_max, start=1, end=0, fun='linear', **kwargs):
             raise ValueError("x_step_down must be between 0 and 1")
         if x_step_up >= x_step_down:
             raise ValueError("x_step_up must be less than x_step_down")
-
         
-        def profile_rule(m, x):
-            x_frac = x / m.L
+        shape_kwargs = {'x_step_up': x_step_up, 'x_step_down': x_step_down, 'smoothness': smoothness}
+
+    else:
+        raise ValueError(f"Unsupported profile type: {fun}")
+
+    # The density fraction depends only on x and is evaluated as a plain float per point
+    # (memoized, so rebuilding a model with the same profile reuses the values)
+    L_val = pyo.value(model.L)
+    shape_items = tuple(sorted(shape_kwargs.items()))
+    def density_fraction(x):
+        return _cached_density_fraction(x, L_val, start, end, fun, shape_items)
+
+    if not getattr(E_max, 'mutable', False):
+        # Fixed E_max: fully numeric profile. The default rule fills in the points added
+        # by discretization on first access, so this can be built before discretize_model
+        E_max_val = pyo.value(E_max)
+        def numeric_rule(m, x):
+            return E_max_val * density_fraction(x)
+        return pyo.Param(model.x, initialize=numeric_rule, default=numeric_rule, within=pyo.NonNegativeReals)
 
+    # Mutable E_max (swept after build) stays symbolic: one E_max * <float> term per x
+    def profile_rule(m, x):
+        return E_max * density_fraction(x)
+    return pyo.Expression(model.x, rule=profile_rule)
+
+def _enzyme_profile_numpy(x, L, start=1, end=0, fun='linear', E_max=1.0,
+                          x_step_up=0.3, x_step_down=0.7, smoothness=100.0):
+    """
+    Closed-form enzyme density at pore position(s) x (float or np.ndarray), see
+    enzyme_profile_rule for the meaning of the arguments. Returns E_max * density fraction.
+    """
+    x_frac = np.asarray(x, dtype=np.float64) / L
+    
+    if fun == 'linear':
+        fraction = start + (end - start) * x_frac
+    
+    elif fun == 'step':
+        # exp() overflows to inf far before a transition, where the sigmoid correctly
+        # evaluates to 0; do not warn about it
+        with np.errstate(over='ignore'):
             # Smooth step-up transition (sigmoid function)
-            step_up_transition   = 1.0 / (1.0 + pyo.exp(-smoothness * (x_frac - x_step_up)))  
+            step_up_transition   = 1.0 / (1.0 + np.exp(-smoothness * (x_frac - x_step_up)))
             
             # Smooth step-down transition (sigmoid function)
-            step_down_transition = 1.0 / (1.0 + pyo.exp(-smoothness * (x_frac - x_step_down)))
-            
-            # Combined profile:
-            # - Before step_up: Constant at start value (before step-up) -> start * E_max
-            # - During step_up transition: Smooth step-up transition to (end)
-            # - Plateau: Constant at step_value (plateau) -> end * E_max  
-            # - During step_down transition: Smooth step-down transition to (start)
-            # - After step_down: Constant at start value -> start * E_max
-
-            # (before step_up + (transition->plateau->transition) + after step_down)
-            step_profile = (start * E_max * (1.0 - step_up_transition) +
-                            end * E_max * (step_up_transition - step_down_transition) +
-                            start * E_max * step_down_transition)
-            return step_profile
-        return pyo.Expression(model.x, rule=profile_rule)
-                
+            step_down_transition = 1.0 / (1.0 + np.exp(-smoothness * (x_frac - x_step_down)))
+        
+        # Combined profile:
+        # - Before step_up: Constant at start value (before step-up) -> start * E_max
+        # - During step_up transition: Smooth step-up transition to (end)
+        # - Plateau: Constant at step_value (plateau) -> end * E_max  
+        # - During step_down transition: Smooth step-down transition to (start)
+        # - After step_down: Constant at start value -> start * E_max
 
+        # (before step_up + (transition->plateau->transition) + after step_down)
+        fraction = (start * (1.0 - step_up_transition) +
+                    end * (step_up_transition - step_down_transition) +
+                    start * step_down_transition)
+    
     else:
         raise ValueError(f"Unsupported profile type: {fun}")
+    
+    return E_max * fraction
+
+@functools.lru_cache(maxsize=4096)
+def _cached_density_fraction(x, L, start, end, fun, shape_items):
+    """Density fraction at one point x; shape_items is the hashable (sorted) step kwargs."""
+    return float(_enzyme_profile_numpy(x, L, start, end, fun, **dict(shape_items)))
 
-def calculate_pore_count_coefficient(model, E_profile_expression, E_max):
+def calculate_pore_count_coefficient(model, E_max, start=1, end=0, fun='linear', E_profile=None, **kwargs):
     """
     Calculate pore count coefficient based on area under enzyme profile curve.
     
@@ -80,29 +122,33 @@ def calculate_pore_count_coefficient(model, E_profile_expression, E_max):
     
     Parameters:
     model: Pyomo model object
-    E_profile_expression: Pyomo Expression for enzyme profile (E_x_profile)
     E_max: Maximum enzyme loading parameter
+    start, end, fun, kwargs: enzyme profile definition, as passed to enzyme_profile_rule
+    E_profile: optional Pyomo component (Expression/Param indexed by model.x) to read the profile
+               from instead, e.g. for a custom profile without a closed form
     
     Returns:
     pore_count_coef: Coefficient to multiply Np by in bvp flux rule
     """
-    x_values = sorted(list(model.x))
-    
-    # Sum of enzyme concentrations at discretization points
-    total_enzyme = 0.0
-    count = 0
+    if E_profile is not None:
+        # One pass over the component's constructed data (no per-index __getitem__)
+        n = len(E_profile)
+        x_values = np.fromiter(E_profile.keys(), dtype=np.float64, count=n)
+        E_values = np.fromiter((pyo.value(E) for E in E_profile.values()), dtype=np.float64, count=n)
+        order = np.argsort(x_values)
+        x_values, E_values = x_values[order], E_values[order]
+    else:
+        # Closed-form profile evaluated on all x points at once (ContinuousSet iterates in ascending order)
+        x_values = np.fromiter(model.x, dtype=np.float64)
+        shape_kwargs = {k: v for k, v in kwargs.items() if k in ('x_step_up', 'x_step_down', 'smoothness')}
+        E_values = _enzyme_profile_numpy(x_values, pyo.value(model.L), start, end, fun, 
+                                         E_max=pyo.value(E_max), **shape_kwargs)
     
-    for x in x_values:
-        try:
-            # Use Pyomo's value() function to safely get numerical values
-            enzyme_val = pyo.value(E_profile_expression[x])
-            total_enzyme += enzyme_val
-            count += 1
-        except:
-            continue
+    # Area under the enzyme profile (trapezoidal rule, valid for non-uniform x points)
+    total_enzyme = np.sum(np.diff(x_values) * (E_values[1:] + E_values[:-1]) / 2)
     
     # Average enzyme concentration
-    avg_enzyme = total_enzyme / count if count > 0 else 0
+    avg_enzyme = total_enzyme / (x_values[-1] - x_values[0])
     
     # Reference average (constant E_max) - use value() for Pyomo parameters
     ref_enzyme_avg = pyo.value(E_max)
@@ -1,26 +1,179 @@
 # visualization.py
-import matplotlib.pyplot as plt
+import math
+import multiprocessing
+import sys
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
-import matplotlib
-from matplotlib.ticker import ScalarFormatter, FuncFormatter
-from matplotlib.gridspec import GridSpec
-matplotlib.use('TkAgg')
 import pyomo.environ as pyo
 
-def plot_enzyme_decay_profiles(model, decay_coef=None, ax=None, save_path=None):
+# matplotlib (and its backend) is only loaded once a plot is requested
+_rc_set = False
+# Backend last selected here (lower case); any other active backend was chosen by the caller
+_selected_backend = None
+
+def _pyplot(backend=None, save_path=None):
+    """
+    Select the plotting backend and return matplotlib.pyplot.
+    
+    A backend chosen outside this module (matplotlib.use, %matplotlib inline, MPLBACKEND) is 
+    kept. Otherwise, without an explicit backend, save-only calls (save_path given) use Agg, 
+    so batch runs never start Tk, unless figures are open on the interactive backend; other 
+    calls use TkAgg for interactive display.
+    """
+    global _rc_set, _selected_backend
+    import matplotlib
+    if backend is None:
+        current = matplotlib.rcParams._get_backend_or_none()    # None until one is chosen
+        if current is None or current.lower() == _selected_backend:
+            pyplot = sys.modules.get('matplotlib.pyplot')
+            if not save_path:
+                backend = 'TkAgg'
+            elif current is None or not (pyplot and pyplot.get_fignums()):
+                # Switching backends would close the figures open on the current one
+                backend = 'Agg'
+    if backend is not None:
+        matplotlib.use(backend, force=True)     # no-op if already selected
+        _selected_backend = backend.lower()
+    if not _rc_set:
+        # Let Agg drop sub-pixel vertices of dense collocation curves, and render long
+        # paths in chunks
+        matplotlib.rcParams['path.simplify'] = True
+        matplotlib.rcParams['path.simplify_threshold'] = 1.0
+        matplotlib.rcParams['agg.path.chunksize'] = 10000
+        _rc_set = True
+    import matplotlib.pyplot as plt
+    return plt
+
+# id(ContinuousSet) -> (weak reference to the set, number of points, points as float64 array)
+_grid_cache = {}
+
+def _grid_values(cset):
+    """Points of a (sorted) ContinuousSet as a read-only float64 array, cached until the set changes."""
+    key = id(cset)
+    entry = _grid_cache.get(key)
+    if entry is None or entry[0]() is not cset or entry[1] != len(cset):
+        values = np.fromiter(cset.ordered_data(), dtype=np.float64, count=len(cset))
+        values.flags.writeable = False
+        set_ref = weakref.ref(cset, lambda _, key=key: _grid_cache.pop(key, None))
+        entry = _grid_cache[key] = (set_ref, len(cset), values)
+    return entry[2]
+
+def _bulk_extract(indexed, keys):
+    """
+    Values of an indexed Pyomo component at `keys` as a float64 array.
+    
+    Vars are read from one extract_values() traversal; Expressions are evaluated by calling
+    them, and numeric Params (whose default rule may fill points lazily) by indexing.
+    """
+    if indexed.ctype is pyo.Var:
+        values = indexed.extract_values()
+        return np.fromiter((values[k] for k in keys), dtype=np.float64, count=len(keys))
+    if indexed.ctype is pyo.Expression:
+        return np.fromiter((indexed[k]() for k in keys), dtype=np.float64, count=len(keys))
+    return np.fromiter((pyo.value(indexed[k]) for k in keys), dtype=np.float64, count=len(keys))
+
+# layout key -> Figure, reused by the next reuse_figure=True plot of the same layout
+_figure_pool = {}
+
+def _pooled_figure(key, builder):
+    """
+    Return the pooled figure for `key`, or build one with `builder()` if there is none (or it was
+    closed). A reused figure keeps its artists: the plot functions update them by gid.
+    """
+    import matplotlib.pyplot as plt     # backend already selected by the calling plot function
+    fig = _figure_pool.get(key)
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig = _figure_pool[key] = builder()
+    return fig
+
+def close_pooled_figures():
+    """Close the reused pore/substrate figures (at most one per layout), e.g. at the end of a sweep."""
+    import matplotlib.pyplot as plt
+    for fig in _figure_pool.values():
+        plt.close(fig)
+    _figure_pool.clear()
+
+def _update_or_plot(ax, xs, ys, style, gid, **plot_kwargs):
+    """
+    Set the data of the line tagged `gid` on ax, or plot it if ax has none yet.
+    
+    The view is only autoscaled again if the data range of the line changed.
+    """
+    for line in ax.lines:
+        if line.get_gid() == gid:
+            before = line.get_xydata()
+            line.set_data(xs, ys)
+            after = line.get_xydata()
+            if not (before.size and np.array_equal(before.min(axis=0), after.min(axis=0))
+                    and np.array_equal(before.max(axis=0), after.max(axis=0))):
+                ax.relim()
+                ax.autoscale_view()
+            return line
+    line, = ax.plot(xs, ys, style, gid=gid, **plot_kwargs)
+    return line
+
+def _update_or_text(ax, gid, x, y, text, **text_kwargs):
+    """Set the string of the text tagged `gid` on ax, or add it if ax has none yet."""
+    for artist in ax.texts:
+        if artist.get_gid() == gid:
+            artist.set_text(text)
+            return artist
+    return ax.text(x, y, text, gid=gid, **text_kwargs)
+
+def _half_lives(kA, kB):
+    """First-order half-lives ln(2)/k of enzymes A and B (NaN for k <= 0, i.e. no decay)."""
+    return (math.log(2) / kA if kA > 0 else math.nan,
+            math.log(2) / kB if kB > 0 else math.nan)
+
+# Decay annotation: fixed mathtext structure, only the numbers are interpolated per call
+_DECAY_ANNOTATION_TEMPLATE = (
+    "$k_d^A  = %.3f\\ \\mathrm{min^{-1}}$\n"
+    "$t_{1/2}^A = %.1f\\ \\mathrm{min}$\n"
+    "$k_d^B  = %.3f\\ \\mathrm{min^{-1}}$\n"
+    "$t_{1/2}^B = %.1f\\ \\mathrm{min}$"
+)
+
+# Axes -> blitting state of plot_enzyme_decay_profiles (curves, background, static content)
+_decay_blit_cache = weakref.WeakKeyDictionary()
+
+def _capture_blit_background(ax, lines):
+    """Draw the figure without `lines`, keep the Axes area as background, then blit the lines on it."""
+    canvas = ax.figure.canvas
+    for line in lines:
+        line.set_visible(False)
+    canvas.draw()
+    background = canvas.copy_from_bbox(ax.bbox)
+    for line in lines:
+        line.set_visible(True)
+        ax.draw_artist(line)
+    canvas.blit(ax.bbox)
+    return background
+
+def plot_enzyme_decay_profiles(model, decay_coef=None, ax=None, save_path=None, backend=None,
+                               use_tight_layout=False):
     """
     Plot enzyme decay profiles (decay_A and decay_B) with scientific-style annotations.
 
     Parameters
     ----------
     model : pyo.ConcreteModel
-        Solved Pyomo model containing model.decay_A and model.decay_B expressions.
+        Solved Pyomo model containing the model.decay_A and model.decay_B params.
     decay_coef : dict, optional
         Dictionary with decay coefficients {'kA': value, 'kB': value}.
     ax : matplotlib.axes.Axes, optional
-        Axis to plot on. Creates a new figure if None.
+        Axis to plot on. Creates a new figure if None. Repeated calls on the same axis with
+        the same decay coefficients only redraw (blit) the two curves over the cached
+        background instead of re-plotting and re-styling the whole axis.
     save_path : str, optional
-        If provided, save the figure to this file path.
+        If provided, save the figure to this file path (only when no ax is supplied).
+    backend : str, optional
+        Matplotlib backend to plot with. By default a save-only call (save_path given, no 
+        display) uses the non-interactive Agg backend, and any other call TkAgg.
+    use_tight_layout : bool, optional
+        Recompute the layout with tight_layout instead of the fixed subplots_adjust margins. Only used 
+        when no ax is supplied.
 
     Returns
     -------
@@ -29,19 +182,49 @@ def plot_enzyme_decay_profiles(model, decay_coef=None, ax=None, save_path=None):
     """
     created_fig = False
     if ax is None:
+        plt = _pyplot(backend, save_path)
         fig, ax = plt.subplots(figsize=(10, 6))
         created_fig = True
+        if not use_tight_layout:
+            # Fixed margins for the known figsize and labels
+            fig.subplots_adjust(left=0.10, right=0.95, top=0.92, bottom=0.12)
     else:
+        # A supplied Axes already has its canvas: the backend is left as it is
         fig = ax.figure
 
     # --- Extract data ---
-    t_values = sorted(list(model.time))
-    decay_A_vals = [pyo.value(model.decay_A[t]) for t in t_values]
-    decay_B_vals = [pyo.value(model.decay_B[t]) for t in t_values]
+    t_values = _grid_values(model.time)
+    time_points = model.time.ordered_data()
+    decay_A_vals = _bulk_extract(model.decay_A, time_points)
+    decay_B_vals = _bulk_extract(model.decay_B, time_points)
 
-    # --- Plot decay curves ---
-    lineA, = ax.plot(t_values, decay_A_vals, 'r-', linewidth=3, label='Enzyme A')
-    lineB, = ax.plot(t_values, decay_B_vals, 'b-', linewidth=3, label='Enzyme B')
+    # --- Extract decay coefficients ---
+    decay_coef = decay_coef or {}
+    kA_coef, kB_coef = float(decay_coef.get('kA', 0)), float(decay_coef.get('kB', 0))
+    # Everything drawn besides the two curves depends only on these
+    static_content = (kA_coef, kB_coef, model.tf.value)
+
+    # --- Repeated call on the same Axes: update the curves and blit them over the background ---
+    blit = None if created_fig else _decay_blit_cache.get(ax)
+    if blit is not None and blit['static'] == static_content and all(line in ax.lines for line in blit['lines']):
+        lineA, lineB = blit['lines']
+        lineA.set_data(t_values, decay_A_vals)
+        lineB.set_data(t_values, decay_B_vals)
+        if blit['stale']:
+            # No background yet (second call), or the figure was redrawn (e.g. resized or 
+            # saved) since it was taken
+            blit['background'] = _capture_blit_background(ax, blit['lines'])
+            blit['stale'] = False
+        else:
+            fig.canvas.restore_region(blit['background'])
+            ax.draw_artist(lineA)
+            ax.draw_artist(lineB)
+            fig.canvas.blit(ax.bbox)
+        return fig
+
+    # --- Plot decay curves (updated in place if ax already has them) ---
+    lineA = _update_or_plot(ax, t_values, decay_A_vals, 'r-', 'decay_A', linewidth=3, label='Enzyme A')
+    lineB = _update_or_plot(ax, t_values, decay_B_vals, 'b-', 'decay_B', linewidth=3, label='Enzyme B')
 
     # --- Styling ---
     ax.set_xlabel('Time (min)', fontsize=16, family='serif')
@@ -52,25 +235,15 @@ def plot_enzyme_decay_profiles(model, decay_coef=None, ax=None, save_path=None):
     ax.tick_params(axis='both', labelsize=12)
     ax.set_xlim(0, model.tf.value)
 
-    # --- Extract decay coefficients ---
-    kA_coef = decay_coef.get('kA', 0) if decay_coef else 0
-    kB_coef = decay_coef.get('kB', 0) if decay_coef else 0
-
     # --- Compute half-lives ---
-    half_life_A = np.log(2) / kA_coef if kA_coef > 0 else np.nan
-    half_life_B = np.log(2) / kB_coef if kB_coef > 0 else np.nan
+    half_life_A, half_life_B = _half_lives(kA_coef, kB_coef)
 
     # --- Compose annotation string ---
-    annotation_text = (
-        rf"$k_d^A  = {kA_coef:.3f}\ \mathrm{{min^{{-1}}}}$" + "\n" +
-        rf"$t_{{1/2}}^A = {half_life_A:.1f}\ \mathrm{{min}}$" + "\n" +
-        rf"$k_d^B  = {kB_coef:.3f}\ \mathrm{{min^{{-1}}}}$" + "\n" +
-        rf"$t_{{1/2}}^B = {half_life_B:.1f}\ \mathrm{{min}}$"
-    )
+    annotation_text = _DECAY_ANNOTATION_TEMPLATE % (kA_coef, half_life_A, kB_coef, half_life_B)
 
     # --- Add semi-transparent square bounding box ---
-    ax.text(
-        0.02, 0.05, annotation_text,
+    _update_or_text(
+        ax, 'decay_annotation', 0.02, 0.05, annotation_text,
         transform=ax.transAxes,
         fontsize=14,
         fontfamily='serif',
@@ -79,18 +252,45 @@ def plot_enzyme_decay_profiles(model, decay_coef=None, ax=None, save_path=None):
         bbox=dict(boxstyle='square', facecolor='white', edgecolor='black', alpha=0.90)
     )
 
+    # --- Supplied Axes: set up blitting for the next call ---
+    # The background is only captured (a full draw) by the next call on this Axes, so a 
+    # one-shot call does not pay for a render here
+    if not created_fig and fig.canvas.supports_blit:
+        previous = _decay_blit_cache.get(ax)
+        if previous is not None:
+            fig.canvas.mpl_disconnect(previous['cid'])
+        blit = {'static': static_content, 'lines': (lineA, lineB), 'background': None, 'stale': True}
+        blit['cid'] = fig.canvas.mpl_connect('draw_event', lambda event: blit.__setitem__('stale', True))
+        _decay_blit_cache[ax] = blit
+
     # --- Save or show ---
+    if created_fig and use_tight_layout:
+        fig.tight_layout()
+
     if save_path and created_fig:
         fig.savefig(save_path, dpi=300, bbox_inches='tight')
         print(f"Enzyme decay plot saved to: {save_path}")
 
-    if created_fig:
-        plt.tight_layout()
+    if created_fig and save_path is None:
         plt.show()
+    elif created_fig:
+        # Save-only: nothing shows this figure, so drop it from pyplot (batch runs would
+        # otherwise keep every figure alive); the returned Figure can still be saved again
+        plt.close(fig)
 
     return fig
 
-def plot_enzyme_pore_profiles(model, immobilization, ax=None, save_path=None):
+def _style_pore_axis(ax, ylabel, max_text, gid):
+    """Labels, limits and annotation shared by the two subplots of plot_enzyme_pore_profiles."""
+    ax.set_ylabel(ylabel, fontsize=14, family='serif')
+    ax.set_ylim(0, 10)
+    ax.set_yticks([5])
+    ax.grid(True, alpha=0.3)
+    _update_or_text(ax, gid, 0.02, 0.05, max_text, transform=ax.transAxes,
+                    fontsize=12, family='serif', verticalalignment='bottom', horizontalalignment='left')
+
+def plot_enzyme_pore_profiles(model, immobilization, ax=None, save_path=None, backend=None,
+                              use_tight_layout=False, reuse_figure=False):
     """
     Plot enzyme surface density along the pore (x from 0 to L) in two subplots:
     one for Enzyme A, one for Enzyme B.
@@ -104,75 +304,95 @@ def plot_enzyme_pore_profiles(model, immobilization, ax=None, save_path=None):
     immobilization : str
         'co-immobilization' or 'single'. Default is 'co-immobilization'.
     ax : matplotlib.axes.Axes, optional
-        Not used here; plots into new figure with 2 rows, 1 column.
+        Not used here; plots into a new figure with 2 rows, 1 column.
     save_path : str, optional
         Path to save figure.
+    backend : str, optional
+        Matplotlib backend to plot with. By default a save-only call (save_path given, no 
+        display) uses the non-interactive Agg backend, and any other call TkAgg.
+    use_tight_layout : bool, optional
+        Recompute the layout with tight_layout instead of the fixed subplots_adjust margins.
+    reuse_figure : bool, optional
+        Draw into the figure of the previous reuse_figure=True call with the same immobilization 
+        scheme (while it is open), updating its artists, instead of creating a new one. The 
+        returned Figure is then shared with those calls (see close_pooled_figures).
     
     Returns
     -------
     fig : matplotlib.figure.Figure
     """
-    x_values = sorted(list(model.x))
+    plt = _pyplot(backend, save_path)
+    from matplotlib.ticker import FixedFormatter, FixedLocator
+
+    x_values = _grid_values(model.x)
 
     # Determine EA and EB values based on immobilization
     if immobilization == 'co-immobilization':
-        EA_values = [pyo.value(model.EA_x_profile[x]) for x in x_values]
-        EB_values = [pyo.value(model.EB_x_profile[x]) for x in x_values]
+        x_points = model.x.ordered_data()
+        EA_values = _bulk_extract(model.EA_x_profile, x_points)
+        EB_values = _bulk_extract(model.EB_x_profile, x_points)
     elif immobilization == 'single':
-        EA_values = [pyo.value(model.EA) for _ in x_values]
-        EB_values = [pyo.value(model.EB) for _ in x_values]
+        # Uniform loading: evaluate once and broadcast
+        EA_values = np.full(x_values.size, pyo.value(model.EA))
+        EB_values = np.full(x_values.size, pyo.value(model.EB))
     else:
         raise ValueError("Invalid immobilization scheme: choose 'co-immobilization' or 'single'.")
 
-    EA_max, EB_max = max(EA_values), max(EB_values)
-
-    # Create figure with 2 subplots
-    fig, axes = plt.subplots(2, 1, figsize=(10, 8), sharex=True)
-    ax_A, ax_B = axes
+    EA_max, EB_max = EA_values.max(), EB_values.max()
 
     # Plot title
     if immobilization=='single':
         title_text = f"Enzyme Density Along Pore Length\n (single immobilization)"
     elif immobilization=='co-immobilization':
         title_text = f"Enzyme Density Along Pore Length\n (co-immobilization)"
-    
+
+    # Create (or reuse) figure with 2 subplots
+    def build_figure():
+        return plt.subplots(2, 1, figsize=(10, 8), sharex=True)[0]
+    fig = _pooled_figure(('pore', immobilization), build_figure) if reuse_figure else build_figure()
+    ax_A, ax_B = fig.axes
+
     # Plot Enzyme A
-    ax_A.plot(x_values, EA_values, 'r-', linewidth=4, label='Enzyme A')
-    ax_A.set_ylabel('Enzyme A (μmol/dm²)', fontsize=14, family='serif')
-    ax_A.set_ylim(0, 10)
-    ax_A.set_yticks([5])
-    ax_A.grid(True, alpha=0.3)
-    ax_A.text(0.02, 0.05, f"Max EA = {EA_max:.2f}", transform=ax_A.transAxes,
-              fontsize=12, family='serif', verticalalignment='bottom', horizontalalignment='left')
+    _update_or_plot(ax_A, x_values, EA_values, 'r-', 'EA_profile', linewidth=4, label='Enzyme A')
+    _style_pore_axis(ax_A, 'Enzyme A (μmol/dm²)', f"Max EA = {EA_max:.2f}", 'EA_max')
 
     # Plot Enzyme B
-    ax_B.plot(x_values, EB_values, 'b-', linewidth=4, label='Enzyme B')
+    _update_or_plot(ax_B, x_values, EB_values, 'b-', 'EB_profile', linewidth=4, label='Enzyme B')
+    _style_pore_axis(ax_B, 'Enzyme B (μmol/dm²)', f"Max EB = {EB_max:.2f}", 'EB_max')
     ax_B.set_xlabel('Pore Position x (dm)', fontsize=14, family='serif')
-    ax_B.set_ylabel('Enzyme B (μmol/dm²)', fontsize=14, family='serif')
-    ax_B.set_ylim(0, 10)
-    ax_B.set_yticks([5])
-    ax_B.grid(True, alpha=0.3)
-    ax_B.text(0.02, 0.05, f"Max EB = {EB_max:.2f}", transform=ax_B.transAxes,
-              fontsize=12, family='serif', verticalalignment='bottom', horizontalalignment='left')
 
     # Shared x-axis formatting
-    ax_B.set_xlim(0, model.L.value)
-    ax_B.xaxis.set_major_formatter(ScalarFormatter(useMathText=True))
-    ax_B.ticklabel_format(axis='x', style='scientific', scilimits=(-3, 3))
+    # The x-domain [0, L] is known here: place the ticks and their scientific-notation labels 
+    # once (as the mathtext ScalarFormatter would) instead of formatting them on every draw
+    L = model.L.value
+    exponent = int(np.floor(np.log10(L)))
+    x_ticks = np.linspace(0, L, 9)
+    formatter = FixedFormatter([f"{tick / 10**exponent:.2f}" for tick in x_ticks])
+    formatter.set_offset_string(rf"$\times\mathdefault{{10^{{{exponent}}}}}$")
+    ax_B.set_xlim(0, L)
+    ax_B.xaxis.set_major_locator(FixedLocator(x_ticks))
+    ax_B.xaxis.set_major_formatter(formatter)
     ax_B.tick_params(axis='both', which='major', labelsize=12)
 
     # Overall figure title
     fig.suptitle(title_text, fontsize=16, family='serif')
 
-    plt.tight_layout(rect=[0, 0, 1, 0.95])
+    if use_tight_layout:
+        fig.tight_layout(rect=[0, 0, 1, 0.95])
+    else:
+        # Fixed margins for the known figsize and labels (room for the suptitle)
+        fig.subplots_adjust(left=0.12, right=0.95, top=0.90, bottom=0.10, hspace=0.15)
 
     if save_path:
         fig.savefig(save_path, dpi=300, bbox_inches='tight')
         print(f"Enzyme profile plot saved to: {save_path}")
+        if not reuse_figure:
+            # Save-only: drop the figure from pyplot, as plot_enzyme_decay_profiles does
+            plt.close(fig)
 
     return fig
 
-def plot_substrate_time_profiles(model, save_path=None):
+def plot_substrate_time_profiles(model, save_path=None, backend=None, reuse_figure=False):
     """
     Plot S1, S2, S3 concentrations over time with final values and yields
     displayed on the upper right in journal-style format.
@@ -182,38 +402,50 @@ def plot_substrate_time_profiles(model, save_path=None):
     model : pyo.ConcreteModel
         Solved Pyomo model.
     save_path : str, optional
-        If provided, save the plot to this file path.
+        If provided, save the plot to this file path (the plot is then not shown).
+    backend : str, optional
+        Matplotlib backend to plot with. By default a save-only call (save_path given, no 
+        display) uses the non-interactive Agg backend, and any other call TkAgg.
+    reuse_figure : bool, optional
+        Draw into the figure of the previous reuse_figure=True call (while it is open), updating 
+        its artists, instead of creating a new one (see close_pooled_figures).
     
     Returns
     -------
     fig : matplotlib.figure.Figure
         The generated figure.
     """
-    # Extract time and concentrations
-    t_values = sorted(list(model.time))
-    S1_values = [model.S_0['S1', t]() for t in t_values]
-    S2_values = [model.S_0['S2', t]() for t in t_values]
-    S3_values = [model.S_0['S3', t]() for t in t_values]
+    plt = _pyplot(backend, save_path)
+
+    # Extract time and concentrations (one extract_values() pass over S_0, one row per component)
+    t_values = _grid_values(model.time)
+    S_keys = [(c, t) for c in model.Components for t in model.time]
+    S_values = _bulk_extract(model.S_0, S_keys).reshape(len(model.Components), t_values.size)
+    S1_values, S2_values, S3_values = S_values
 
     # Final and initial values
-    final_S1, final_S2, final_S3 = S1_values[-1], S2_values[-1], S3_values[-1]
-    initial_S1 = S1_values[0]
+    final_S1, final_S2, final_S3 = S_values[:, -1]
+    initial_S1 = S_values[0, 0]
 
     # Yield calculations
     Y_S2 = final_S2 / initial_S1
     Y_S3 = final_S3 / initial_S1
 
-    # Create figure layout (2/3 plot, 1/3 info)
-    fig = plt.figure(figsize=(14, 6))
-    gs = GridSpec(1, 3, width_ratios=[2, 0.05, 1], figure=fig)
-
-    ax = fig.add_subplot(gs[0])  # main plot
-    ax_text = fig.add_subplot(gs[2])  # text panel
+    # Create (or reuse) figure layout (2/3 plot, 1/3 info). The info panel is a figure-level 
+    # text next to the single Axes, so the layout is fixed and needs no tight_layout pass
+    def build_figure():
+        fig, _ = plt.subplots(figsize=(14, 6))
+        fig.subplots_adjust(left=0.07, right=0.66, bottom=0.12, top=0.92)
+        fig.text(0.70, 0.90, '', fontsize=16, fontfamily='serif', va='top', ha='left')
+        return fig
+    fig = _pooled_figure('substrate', build_figure) if reuse_figure else build_figure()
+    ax, = fig.axes
+    info_text, = fig.texts
 
     # Plot concentration profiles
-    ax.plot(t_values, S1_values, 'k-', linewidth=3, label='S1 (Substrate)')
-    ax.plot(t_values, S2_values, 'b-', linewidth=3, label='S2 (Intermediate)')
-    ax.plot(t_values, S3_values, 'r-', linewidth=3, label='S3 (Product)')
+    _update_or_plot(ax, t_values, S1_values, 'k-', 'S1', linewidth=3, label='S1 (Substrate)')
+    _update_or_plot(ax, t_values, S2_values, 'b-', 'S2', linewidth=3, label='S2 (Intermediate)')
+    _update_or_plot(ax, t_values, S3_values, 'r-', 'S3', linewidth=3, label='S3 (Product)')
 
     # Axes settings
     ax.set_xlabel('Reaction time, t (min)', fontsize=16, family='serif')
@@ -224,9 +456,6 @@ def plot_substrate_time_profiles(model, save_path=None):
     ax.tick_params(axis='both', labelsize=12)
     ax.grid(True, linestyle='--', alpha=0.5)
 
-    # Remove axes for right panel
-    ax_text.axis('off')
-
     # Text (scientific journal style)
     text_str = (
         f"$\\bf{{Final\\ Concentrations}}$\n"
@@ -239,18 +468,72 @@ def plot_substrate_time_profiles(model, save_path=None):
     )
 
     # Place text in upper right
-    ax_text.text(
-        0.0, 0.95, text_str,
-        transform=ax_text.transAxes,
-        fontsize=16, fontfamily='serif', va='top', ha='left'
-    )
-
-    plt.tight_layout()
+    info_text.set_text(text_str)
 
     # Save if needed
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=300, bbox_inches='tight')
         print(f"Substrate concentration plot saved to: {save_path}")
-
-    plt.show()
+        if not reuse_figure:
+            # Save-only: drop the figure from pyplot, as plot_enzyme_decay_profiles does
+            plt.close(fig)
+    else:
+        plt.show()
     return fig
+
+# (plot function name, model, save_path, plot kwargs) jobs of the running batch_plot; forked
+# workers inherit them, since Pyomo models with rule functions cannot be pickled
+_batch_jobs = []
+
+def _batch_plot_job(job_index):
+    """Worker for batch_plot: render and save one plot with Agg, close it, return its save_path."""
+    plt = _pyplot('Agg')
+    _figure_pool.clear()    # pooled figures inherited from the parent belong to its canvases
+    func_name, model, save_path, plot_kwargs = _batch_jobs[job_index]
+    fig = globals()[func_name](model, save_path=save_path, backend='Agg', **plot_kwargs)
+    plt.close(fig)
+    return save_path
+
+def batch_plot(models_and_paths, func, max_workers=None, **plot_kwargs):
+    """
+    Save one plot per (model, save_path) pair, rendered in parallel worker processes.
+    
+    The plots are independent, so each is drawn with the Agg backend in a forked worker that
+    inherits the models (no pickling). Forking is only used on Linux (on macOS it is unsafe 
+    with the Tk/Objective-C runtime loaded); elsewhere the plots are drawn here, one after another.
+
+    Parameters
+    ----------
+    models_and_paths : iterable of (pyo.ConcreteModel, str)
+        Solved models and the file path to save each plot to.
+    func : callable
+        plot_enzyme_decay_profiles, plot_enzyme_pore_profiles or plot_substrate_time_profiles.
+    max_workers : int, optional
+        Number of worker processes (default: os.cpu_count()).
+    **plot_kwargs
+        Passed on to func, e.g. immobilization='single' or decay_coef={...}.
+
+    Returns
+    -------
+    list of str
+        The save paths, in input order.
+    """
+    # Workers look the function up by name in this module
+    if func not in (plot_enzyme_decay_profiles, plot_enzyme_pore_profiles, plot_substrate_time_profiles):
+        raise ValueError("Invalid plot function: choose plot_enzyme_decay_profiles, "
+                         "plot_enzyme_pore_profiles or plot_substrate_time_profiles.")
+
+    jobs = [(func.__name__, model, save_path, plot_kwargs) for model, save_path in models_and_paths]
+    if not sys.platform.startswith('linux') or 'fork' not in multiprocessing.get_all_start_methods():
+        plt = _pyplot('Agg')
+        for _, model, save_path, _ in jobs:
+            plt.close(func(model, save_path=save_path, backend='Agg', **plot_kwargs))
+        return [save_path for _, _, save_path, _ in jobs]
+
+    _batch_jobs[:] = jobs
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context('fork')) as executor:
+            return list(executor.map(_batch_plot_job, range(len(jobs))))
+    finally:
+        _batch_jobs.clear()